@@ -1,14 +1,161 @@
+import re
+import types
+from functools import lru_cache
+
+import numpy as np
 import unyt
 from unyt import MW, hr
-from unyt import unyt_quantity
-from unyt.exceptions import UnitParseError, UnitConversionError
+from unyt import unyt_array, unyt_quantity
+from unyt.exceptions import (UnitParseError, UnitConversionError,
+                              IterableUnitCoercionError)
+
+
+class _Dim(object):
+    """
+    The resolved unit for each accepted dimension. Internal callers
+    pass these directly to :func:`_validate_quantity_fast` to skip the
+    string lookup in :func:`_validate_quantity`.
+    """
+    time = hr
+    power = MW
+    energy = MW * hr
+    spec_power = MW**-1
+    spec_energy = (MW * hr)**-1
+
+
+# Read-only, since the caches below assume these units never change.
+_dim_opts = types.MappingProxyType({'time': _Dim.time,
+                                    'power': _Dim.power,
+                                    'energy': _Dim.energy,
+                                    'spec_power': _Dim.spec_power,
+                                    'spec_energy': _Dim.spec_energy})
+_dim_names = types.MappingProxyType(
+    {unit: dimension for dimension, unit in _dim_opts.items()})
+
+# Maps the dimensions of each unit seen so far to the name of the matching
+# dimension in `_dim_opts` (or None), so that dimension checks become a
+# dictionary lookup instead of a SymPy comparison.
+_dim_cache = {}
+
+
+def _dim_of(unit):
+    """
+    Finds which of the accepted dimensions `unit` has.
 
+    Parameters
+    ----------
+    unit : :class:`unyt.unit_object.Unit`
+        The unit being tested.
+
+    Returns
+    -------
+    dimension : string or None
+        The matching key of `_dim_opts`, or None if there is no match.
+    """
+    dimensions = unit.dimensions
+    try:
+        return _dim_cache[dimensions]
+    except KeyError:
+        pass
+
+    match = None
+    for dimension, exp_dim in _dim_opts.items():
+        if unit.same_dimensions_as(exp_dim):
+            match = dimension
+            break
+    _dim_cache[dimensions] = match
+    return match
+
+
+for _unit in _dim_opts.values():
+    _dim_of(_unit)
+
+# Simple "<number> <unit>" strings, and inverses such as
+# "10 (MW*hr)**-1" (which :meth:`unyt_quantity.from_string` rejects), are
+# parsed without SymPy. Anything else, including unit symbols that
+# :class:`unyt.Unit` cannot parse, falls back to `from_string` so that
+# malformed strings raise the same errors as before.
+_number_pattern = r"[+-]?\d+(?:\.\d*)?(?:[eE][+-]?\d+)?"
+_unit_pattern = r"[A-Za-z][\w*/\-]*"
+_inverse_pattern = rf"\(\s*({_unit_pattern})\s*\)\*\*-1"
+_quantity_re = re.compile(
+    rf"^\s*({_number_pattern})(?:\s+({_unit_pattern}))?\s*$")
+_inverse_quantity_re = re.compile(
+    rf"^\s*({_number_pattern})\s+{_inverse_pattern}\s*$")
+_unit_re = re.compile(rf"^\s*({_unit_pattern})\s*$")
+_inverse_unit_re = re.compile(rf"^\s*{_inverse_pattern}\s*$")
+_unit_str_cache = {}
+
+
+def _resolve_unit(unit_str):
+    """
+    Looks up a unit symbol such as ``"MW**-1"``, parsing it with
+    :class:`unyt.Unit` the first time it is seen.
+
+    Parameters
+    ----------
+    unit_str : string
+        The unit symbol.
+
+    Returns
+    -------
+    unit : :class:`unyt.unit_object.Unit` or None
+        The parsed unit, or None if :class:`unyt.Unit` cannot parse
+        `unit_str`. Callers then fall back to
+        :meth:`unyt_quantity.from_string`.
+    """
+    unit = _unit_str_cache.get(unit_str)
+    if unit is None:
+        try:
+            unit = unyt.Unit(unit_str)
+        except UnitParseError:
+            return None
+        _unit_str_cache[unit_str] = unit
+    return unit
+
+
+@lru_cache(maxsize=64)
+def _inverse_unit(unit):
+    """
+    Memoized ``unit**-1``. Inverting a unit costs a SymPy operation, and
+    the same few units are inverted every time a :class:`Technology` is
+    created or its units change.
+    """
+    return unit**-1
+
+
+@lru_cache(maxsize=64)
+def _energy_unit(unit_power, unit_time):
+    """
+    Memoized ``unit_power * unit_time``.
+    """
+    return unit_power * unit_time
+
+
+def _get_handler(handlers, value):
+    """
+    Looks up the handler for `value` by its exact type, falling back
+    to an :func:`isinstance` check for subclasses of the handled types.
+
+    Parameters
+    ----------
+    handlers : dict
+        Maps accepted types to their handler functions.
+    value : object
+        The value being validated.
 
-_dim_opts = {'time': hr,
-             'power': MW,
-             'energy': MW * hr,
-             'spec_power': MW**-1,
-             'spec_energy': (MW * hr)**-1}
+    Returns
+    -------
+    handler : function
+        The handler for `value`.
+    """
+    handler = handlers.get(type(value))
+    if handler is not None:
+        return handler
+    for kind, kind_handler in handlers.items():
+        if isinstance(value, kind):
+            return kind_handler
+    raise ValueError(f"Value of type <{type(value)}> passed.")
 
 
 def _validate_unit(value, dimension):
@@ -30,31 +177,136 @@ def _validate_unit(value, dimension):
     valid_unit : :class:`unyt.unit_object.Unit`
         The validated unit.
     """
-    try:
-        exp_dim = _dim_opts[dimension]
-    except KeyError:
-        raise KeyError(f"Key <{dimension}> not accepted. Try: {_dim_opts}")
+    if type(value) in _unit_handlers:
+        return _validate_unit_cached(value, dimension)
+    return _validate_unit_uncached(value, dimension)
+
+
+@lru_cache(maxsize=256)
+def _validate_unit_cached(value, dimension):
+    """
+    Memoized form of :func:`_validate_unit` for hashable inputs. Unit
+    strings are heavily repeated, so this skips re-parsing them.
+    Call ``_validate_unit_cached.cache_clear()`` after registering
+    new units with :mod:`unyt`.
+    """
+    return _validate_unit_uncached(value, dimension)
+
+
+def _validate_unit_uncached(value, dimension):
+    """
+    Unmemoized form of :func:`_validate_unit`. Checks `dimension` and
+    dispatches `value` to its handler in `_unit_handlers`.
+
+    Parameters
+    ----------
+    value : string or :class:`unyt.unit_object.Unit`
+        The value being tested.
+    dimension : string
+        The expected dimensions of `value`.
+
+    Returns
+    -------
+    valid_unit : :class:`unyt.unit_object.Unit`
+        The validated unit.
+    """
+    if dimension not in _dim_opts:
+        raise KeyError(f"Key <{dimension}> not accepted. Try: {dict(_dim_opts)}")
+
+    return _get_handler(_unit_handlers, value)(value, dimension)
+
+
+def _unit_from_unit(value, dimension):
+    """
+    Handler for :class:`unyt.unit_object.Unit` values in
+    :func:`_validate_unit`.
+
+    Parameters
+    ----------
+    value : :class:`unyt.unit_object.Unit`
+        The unit being tested.
+    dimension : string
+        The expected dimensions of `value`.
+
+    Returns
+    -------
+    valid_unit : :class:`unyt.unit_object.Unit`
+        `value`, once its dimensions are checked.
+    """
+    if _dim_of(value) != dimension:
+        raise AssertionError(f"{value} lacks units of {dimension}.")
+    return value
+
+
+def _unit_from_str(value, dimension):
+    """
+    Handler for string values in :func:`_validate_unit`. Simple unit
+    symbols are resolved without SymPy; anything else is parsed with
+    :meth:`unyt_quantity.from_string`.
+
+    Parameters
+    ----------
+    value : string
+        The unit symbol being tested, e.g. ``"MW"``.
+    dimension : string
+        The expected dimensions of `value`.
 
-    valid_unit = None
-    if isinstance(value, unyt.unit_object.Unit):
-        assert value.same_dimensions_as(exp_dim)
-        valid_unit = value
-    elif isinstance(value, str):
+    Returns
+    -------
+    valid_unit : :class:`unyt.unit_object.Unit`
+        The parsed and validated unit.
+    """
+    unit = None
+    match = _unit_re.match(value)
+    inverse_match = _inverse_unit_re.match(value)
+    if match is not None:
+        unit = _resolve_unit(match.group(1))
+    elif inverse_match is not None:
+        unit = _resolve_unit(inverse_match.group(1))
+        if unit is not None:
+            unit = _inverse_unit(unit)
+
+    if unit is None:
         try:
             unit = unyt_quantity.from_string(value).units
-            assert unit.same_dimensions_as(exp_dim)
-            valid_unit = unit
         except UnitParseError:
             raise UnitParseError(f"Could not interpret <{value}>.")
-        except AssertionError:
-            raise AssertionError(f"{value} lacks units of {dimension}.")
-    else:
-        raise ValueError(f"Value of type <{type(value)}> passed.")
+    if _dim_of(unit) != dimension:
+        raise AssertionError(f"{value} lacks units of {dimension}.")
+    return unit
+
+
+_unit_handlers = {unyt.unit_object.Unit: _unit_from_unit,
+                  str: _unit_from_str}
+
+
+def _to_if_needed(quantity, unit):
+    """
+    Converts `quantity` to `unit`, skipping the conversion when the
+    quantity is already expressed in that unit. Equal units that are
+    distinct objects (e.g. ``(MW*hr)**-1`` built twice) only relabel
+    the quantity, which is much cheaper than :meth:`unyt_array.to`.
 
-    return valid_unit
+    Parameters
+    ----------
+    quantity : :class:`unyt.unyt_quantity`
+        The quantity to convert.
+    unit : :class:`unyt.unit_object.Unit`
+        The target unit.
+
+    Returns
+    -------
+    quantity : :class:`unyt.unyt_quantity`
+        The quantity expressed in `unit`.
+    """
+    if quantity.units is unit:
+        return quantity
+    if quantity.units == unit:
+        return type(quantity)(quantity.d, unit)
+    return quantity.to(unit)
 
 
-def _validate_quantity(value, dimension):
+def _validate_quantity(value, dimension, target_unit=None):
     """
     This function checks that a quantity has the correct
     dimensions. Used in :class:`Technology` to set
@@ -71,42 +323,212 @@ def _validate_quantity(value, dimension):
     dimension : string
         The expected dimensions of `value`.
         Currently accepts: ['time', 'energy', 'power', 'spec_power', 'spec_energy'].
+    target_unit : :class:`unyt.unit_object.Unit`
+        An optional parameter, the unit the validated quantity is
+        converted to. Must have the dimensions of `dimension`.
 
     Returns
     -------
     valid_quantity : :class:`unyt.unyt_quantity`
         The validated quantity.
     """
+    exp_dim = _dim_opts.get(dimension)
+    if exp_dim is None:
+        raise KeyError(f"Key <{dimension}> not accepted. Try: {dict(_dim_opts)}")
+
+    return _validate_quantity_fast(value, exp_dim, target_unit)
+
+
+def _validate_quantity_fast(value, exp_dim, target_unit=None):
+    """
+    Same as :func:`_validate_quantity`, but takes the expected unit
+    directly (one of the :class:`_Dim` attributes) instead of the
+    dimension name.
+
+    Parameters
+    ----------
+    value : string, float, int, or :class:`unyt.unyt_quantity`
+        The value being tested.
+    exp_dim : :class:`unyt.unit_object.Unit`
+        The default unit of the expected dimension, e.g. ``_Dim.power``.
+    target_unit : :class:`unyt.unit_object.Unit`
+        An optional parameter, the unit the validated quantity is
+        converted to.
+
+    Returns
+    -------
+    valid_quantity : :class:`unyt.unyt_quantity`
+        The validated quantity.
+    """
+    handler = _get_handler(_quantity_handlers, value)
+    return handler(value, exp_dim, target_unit)
+
+
+def _quantity_from_unyt(value, exp_dim, target_unit):
+    """
+    Handler for :class:`unyt.unyt_quantity` values in
+    :func:`_validate_quantity_fast`.
+
+    Parameters
+    ----------
+    value : :class:`unyt.unyt_quantity`
+        The quantity being tested.
+    exp_dim : :class:`unyt.unit_object.Unit`
+        The default unit of the expected dimension.
+    target_unit : :class:`unyt.unit_object.Unit` or None
+        The unit to convert to. Defaults to `exp_dim`.
+
+    Returns
+    -------
+    valid_quantity : :class:`unyt.unyt_quantity`
+        A new float quantity in `target_unit`.
+    """
+    if target_unit is None:
+        target_unit = exp_dim
     try:
-        exp_dim = _dim_opts[dimension]
-    except KeyError:
-        raise KeyError(f"Key <{dimension}> not accepted. Try: {_dim_opts}")
+        # Always builds a new float quantity, so that later in-place
+        # changes to the caller's `value` do not reach the stored copy.
+        return _quantity_in(float(value.d), value.units, target_unit)
+    except UnitConversionError:
+        raise TypeError(f"Cannot convert {value.units} to {exp_dim}")
 
-    valid_quantity = None
-    if isinstance(value, unyt_quantity):
+
+@lru_cache(maxsize=256)
+def _conversion_factor(units, target_unit):
+    """
+    Memoized multiplicative factor from `units` to `target_unit`.
+    """
+    return units.get_conversion_factor(target_unit)[0]
+
+
+def _quantity_in(magnitude, units, target_unit):
+    """
+    Builds a quantity from a bare `magnitude` in `units`, expressed in
+    `target_unit` if given. Scaling the bare number by a cached factor
+    avoids building an intermediate quantity and calling
+    :meth:`unyt_array.to` on it.
+    """
+    if target_unit is None or target_unit is units:
+        return unyt_quantity(magnitude, units)
+    return unyt_quantity(magnitude * _conversion_factor(units, target_unit),
+                         target_unit)
+
+
+def _quantity_from_number(value, exp_dim, target_unit):
+    """
+    Handler for float and int values in :func:`_validate_quantity_fast`.
+    The bare number is read in `exp_dim` and the quantity is built
+    directly, avoiding the ``Unit.__rmul__`` dispatch of
+    ``value * exp_dim``.
+    """
+    return _quantity_in(float(value), exp_dim, target_unit)
+
+
+def _quantity_from_str(value, exp_dim, target_unit):
+    """
+    Handler for string values in :func:`_validate_quantity_fast`.
+    """
+    magnitude, units = _parse_quantity_string(value, exp_dim)
+    return _quantity_in(magnitude, units, target_unit)
+
+
+_quantity_handlers = {unyt_quantity: _quantity_from_unyt,
+                      float: _quantity_from_number,
+                      int: _quantity_from_number,
+                      str: _quantity_from_str}
+
+
+def _validate_array(values, size, exp_dim, target_unit):
+    """
+    Vectorized counterpart of :func:`_validate_quantity_fast`. Used in
+    :meth:`Technology.from_arrays` to validate a whole data column with
+    a single conversion.
+
+    Parameters
+    ----------
+    values : float, array-like, or :class:`unyt.unyt_array`
+        The values being tested. Scalars are broadcast to `size`.
+        A list of quantities is converted to a common unit first; it
+        may not mix quantities and plain numbers.
+    size : int
+        The expected number of values.
+    exp_dim : :class:`unyt.unit_object.Unit`
+        The default unit of the expected dimension, e.g. ``_Dim.power``.
+    target_unit : :class:`unyt.unit_object.Unit`
+        The unit the validated values are converted to.
+
+    Returns
+    -------
+    valid_array : :class:`unyt.unyt_array`
+        The validated values, with shape ``(size,)``.
+    """
+    if isinstance(values, (list, tuple)) and any(
+            isinstance(value, unyt_array) for value in values):
+        if not all(isinstance(value, unyt_array) for value in values):
+            raise ValueError("Cannot mix quantities and plain numbers "
+                             f"in one column: {values}")
         try:
-            valid_quantity = value.to(exp_dim)
-        except UnitConversionError:
-            raise TypeError(f"Cannot convert {value.units} to {exp_dim}")
-    elif isinstance(value, float):
-        valid_quantity = value * exp_dim
-    elif isinstance(value, int):
-        valid_quantity = value * exp_dim
-    elif isinstance(value, str):
+            values = unyt_array(values)
+        except IterableUnitCoercionError:
+            raise TypeError(f"Values have incompatible units: {values}")
+    elif not isinstance(values, unyt_array):
+        values = unyt_array(np.asarray(values, dtype=float), exp_dim)
+    try:
+        values = _to_if_needed(values, target_unit).astype(float, copy=False)
+    except UnitConversionError:
+        raise TypeError(f"Cannot convert {values.units} to {exp_dim}")
+
+    if values.ndim == 0:
+        return unyt_array(np.full(size, values.d), values.units)
+    if values.shape != (size,):
+        raise ValueError(f"Expected {size} values, got shape {values.shape}.")
+    return values
+
+
+@lru_cache(maxsize=256)
+def _parse_quantity_string(value, exp_dim):
+    """
+    Parses and validates the string branch of :func:`_validate_quantity`.
+    The magnitude and units are cached rather than the quantity itself,
+    since :class:`unyt.unyt_quantity` objects are mutable.
+
+    Returns
+    -------
+    magnitude : float
+        The numerical value of the quantity.
+    units : :class:`unyt.unit_object.Unit`
+        The validated units of the quantity.
+    """
+    match = _quantity_re.match(value)
+    inverse_match = _inverse_quantity_re.match(value)
+    if match is None and inverse_match is None:
         try:
-            valid_quantity = float(value) * exp_dim
+            return float(value), exp_dim
         except ValueError:
-            try:
-                unyt_value = unyt_quantity.from_string(value)
-                assert unyt_value.units.same_dimensions_as(exp_dim)
-                valid_quantity = unyt_value
-            except UnitParseError:
-                raise UnitParseError(f"Could not interpret <{value}>.")
-            except AssertionError:
-                raise AssertionError(f"{value} lacks units of {dimension}.")
-    else:
-        raise ValueError(f"Value of type <{type(value)}> passed.")
-    return valid_quantity
+            pass
+    elif match is not None and match.group(2) is None:
+        return float(match.group(1)), exp_dim
+
+    units = None
+    if match is not None:
+        magnitude = float(match.group(1))
+        units = _resolve_unit(match.group(2))
+    elif inverse_match is not None:
+        magnitude = float(inverse_match.group(1))
+        units = _resolve_unit(inverse_match.group(2))
+        if units is not None:
+            units = _inverse_unit(units)
+
+    if units is None:
+        try:
+            unyt_value = unyt_quantity.from_string(value)
+        except UnitParseError:
+            raise UnitParseError(f"Could not interpret <{value}>.")
+        magnitude, units = unyt_value.value, unyt_value.units
+    dimension = _dim_names[exp_dim]
+    if _dim_of(units) != dimension:
+        raise AssertionError(f"{value} lacks units of {dimension}.")
+    return magnitude, units
 
 
 class Technology(object):
@@ -141,8 +563,9 @@ class Technology(object):
     default_energy_units : str or :class:`unyt.unit_object.Unit`
         An optional parameter, specifies the units
         for energy. Default is megawatt-hours [MWh]
-        Currently, `default_energy_units` is derived from the
-        time and power units.
+        Currently, `default_energy_units` is ignored: the energy
+        units are derived from the time and power units, and
+        :attr:`unit_energy` is read-only.
 
     Notes
     -----
@@ -163,9 +586,28 @@ class Technology(object):
     >>> my_unit = unyt_quantity.from_string(my_unit)
     unyt_quantity(10., '1/MW')
 
-    However, inverse MWh cannot be converted from a string.
+    However, inverse MWh cannot be converted from a string by
+    :class:`unyt`. :class:`Technology` accepts the parenthesized form
+    for its own attributes:
+
+    >>> tech = Technology("nuclear", om_cost_variable="10 (MW*hr)**-1")
+    >>> tech.om_cost_variable
+    unyt_quantity(10., '1/(MW*hr)')
     """
 
+    __slots__ = ('technology_name',
+                 'technology_type',
+                 '_unit_power',
+                 '_unit_time',
+                 '_unit_energy',
+                 '_inv_unit_power',
+                 '_inv_unit_energy',
+                 '_capacity',
+                 '_capital_cost',
+                 '_om_cost_fixed',
+                 '_om_cost_variable',
+                 '_fuel_cost')
+
     def __init__(self,
                  technology_name,
                  technology_type='base',
@@ -181,15 +623,206 @@ class Technology(object):
         self.technology_name = technology_name
         self.technology_type = technology_type
 
-        self.unit_power = default_power_units
-        self.unit_time = default_time_units
-        self.unit_energy = default_energy_units
-
-        self.capacity = capacity
-        self.capital_cost = capital_cost
-        self.om_cost_fixed = om_cost_fixed
-        self.om_cost_variable = om_cost_variable
-        self.fuel_cost = fuel_cost
+        self._unit_power = _validate_unit(default_power_units,
+                                          dimension="power")
+        self._unit_time = _validate_unit(default_time_units, dimension="time")
+        self._update_derived_units()
+
+        # All units are resolved at this point, so each quantity is
+        # validated straight into its display unit in a single pass. Zero
+        # defaults are valid in any unit, so they skip validation.
+        for name, value, exp_dim, unit in (
+                ('_capacity', capacity, _Dim.power, self._unit_power),
+                ('_capital_cost', capital_cost,
+                 _Dim.spec_power, self._inv_unit_power),
+                ('_om_cost_fixed', om_cost_fixed,
+                 _Dim.spec_power, self._inv_unit_power),
+                ('_om_cost_variable', om_cost_variable,
+                 _Dim.spec_energy, self._inv_unit_energy),
+                ('_fuel_cost', fuel_cost,
+                 _Dim.spec_energy, self._inv_unit_energy)):
+            if type(value) is float and value == 0.0:
+                valid_quantity = unyt_quantity(0.0, unit)
+            else:
+                valid_quantity = _validate_quantity_fast(
+                    value, exp_dim, target_unit=unit)
+            setattr(self, name, valid_quantity)
+
+    def _update_derived_units(self):
+        """
+        Recomputes the composite units derived from the power and time
+        units, so that getters do not rebuild them on every access.
+        """
+        self._inv_unit_power = _inverse_unit(self._unit_power)
+        self._update_energy_units()
+
+    def _update_energy_units(self):
+        """
+        Recomputes the units derived from the energy unit. Changing the
+        time unit leaves the power-derived units untouched.
+        """
+        self._unit_energy = _energy_unit(self._unit_power, self._unit_time)
+        self._inv_unit_energy = _inverse_unit(self._unit_energy)
+
+    def _convert_quantities(self):
+        """
+        Re-expresses the stored quantities in the current units. Every
+        code path that stores a quantity or changes a unit keeps them in
+        the current units, so getters only copy them instead of
+        converting. The copy keeps in-place edits of a returned value
+        from changing the technology.
+        """
+        self._capacity = _to_if_needed(self._capacity, self._unit_power)
+        self._capital_cost = _to_if_needed(self._capital_cost,
+                                           self._inv_unit_power)
+        self._om_cost_fixed = _to_if_needed(self._om_cost_fixed,
+                                            self._inv_unit_power)
+        self._om_cost_variable = _to_if_needed(self._om_cost_variable,
+                                               self._inv_unit_energy)
+        self._fuel_cost = _to_if_needed(self._fuel_cost,
+                                        self._inv_unit_energy)
+
+    @classmethod
+    def from_arrays(cls,
+                    technology_name,
+                    technology_type='base',
+                    capital_cost=0.0,
+                    om_cost_fixed=0.0,
+                    om_cost_variable=0.0,
+                    fuel_cost=0.0,
+                    capacity=0.0,
+                    default_power_units=MW,
+                    default_time_units=hr):
+        """
+        Creates one :class:`Technology` per entry in `technology_name`.
+        Each data column is validated and converted once, rather than
+        once per technology.
+
+        Parameters
+        ----------
+        technology_name : list of strings
+            The name identifiers of the technologies.
+        technology_type : string or list of strings
+            The string identifiers for the types of technology.
+        capital_cost, om_cost_fixed, om_cost_variable, fuel_cost, capacity : float, array-like, or :class:`unyt.unyt_array`
+            The data columns, with the same default units as
+            :class:`Technology`. Scalars apply to every technology.
+        default_power_units : str or :class:`unyt.unit_object.Unit`
+            An optional parameter, specifies the units
+            for power. Default is megawatts [MW].
+        default_time_units : str or :class:`unyt.unit_object.Unit`
+            An optional parameter, specifies the units
+            for time. Default is hours [hr].
+
+        Returns
+        -------
+        technologies : list of :class:`Technology`
+            The new technologies.
+        """
+        names = list(technology_name)
+        size = len(names)
+        if isinstance(technology_type, str):
+            technology_types = [technology_type] * size
+        else:
+            technology_types = list(technology_type)
+            if len(technology_types) != size:
+                raise ValueError(f"Expected {size} values, got shape "
+                                 f"({len(technology_types)},).")
+
+        unit_power = _validate_unit(default_power_units, dimension="power")
+        unit_time = _validate_unit(default_time_units, dimension="time")
+        inv_unit_power = _inverse_unit(unit_power)
+        inv_unit_energy = _inverse_unit(_energy_unit(unit_power, unit_time))
+
+        capacities = _validate_array(
+            capacity, size, _Dim.power, unit_power)
+        capital_costs = _validate_array(
+            capital_cost, size, _Dim.spec_power, inv_unit_power)
+        om_costs_fixed = _validate_array(
+            om_cost_fixed, size, _Dim.spec_power, inv_unit_power)
+        om_costs_variable = _validate_array(
+            om_cost_variable, size, _Dim.spec_energy, inv_unit_energy)
+        fuel_costs = _validate_array(
+            fuel_cost, size, _Dim.spec_energy, inv_unit_energy)
+
+        return [cls._unchecked(names[i],
+                               technology_types[i],
+                               capacity=capacities[i],
+                               capital_cost=capital_costs[i],
+                               om_cost_fixed=om_costs_fixed[i],
+                               om_cost_variable=om_costs_variable[i],
+                               fuel_cost=fuel_costs[i],
+                               unit_power=unit_power,
+                               unit_time=unit_time)
+                for i in range(size)]
+
+    @classmethod
+    def _unchecked(cls,
+                   technology_name,
+                   technology_type='base',
+                   *,
+                   capacity,
+                   capital_cost,
+                   om_cost_fixed,
+                   om_cost_variable,
+                   fuel_cost,
+                   unit_power=MW,
+                   unit_time=hr):
+        """
+        Creates a :class:`Technology` from already validated data, for
+        trusted internal callers. Nothing is validated: `unit_power` and
+        `unit_time` must be :class:`unyt.unit_object.Unit` objects, and
+        each quantity must already be in the display units derived from
+        them.
+        """
+        tech = cls.__new__(cls)
+        tech.technology_name = technology_name
+        tech.technology_type = technology_type
+        tech._unit_power = unit_power
+        tech._unit_time = unit_time
+        tech._update_derived_units()
+        tech._capacity = capacity
+        tech._capital_cost = capital_cost
+        tech._om_cost_fixed = om_cost_fixed
+        tech._om_cost_variable = om_cost_variable
+        tech._fuel_cost = fuel_cost
+        return tech
+
+    @staticmethod
+    def to_arrays(technologies):
+        """
+        The inverse of :meth:`from_arrays`. Collects the attributes of
+        `technologies` into one column per attribute.
+
+        Parameters
+        ----------
+        technologies : list of :class:`Technology`
+            The technologies to collect. Quantities are expressed in
+            the units of the first technology, or in the default units
+            (MW and hr) if the list is empty.
+
+        Returns
+        -------
+        columns : dict
+            Maps each :meth:`from_arrays` argument name to a list of
+            strings or a :class:`unyt.unyt_array`.
+        """
+        columns = {
+            'technology_name': [t.technology_name for t in technologies],
+            'technology_type': [t.technology_type for t in technologies]}
+        for attr, default_unit in (('capital_cost', _Dim.spec_power),
+                                   ('om_cost_fixed', _Dim.spec_power),
+                                   ('om_cost_variable', _Dim.spec_energy),
+                                   ('fuel_cost', _Dim.spec_energy),
+                                   ('capacity', _Dim.power)):
+            if technologies:
+                unit = getattr(technologies[0], attr).units
+            else:
+                unit = default_unit
+            columns[attr] = unyt_array(
+                [_to_if_needed(getattr(t, attr), unit).d
+                 for t in technologies], unit)
+        return columns
 
     @property
     def unit_power(self):
@@ -198,6 +831,8 @@ class Technology(object):
     @unit_power.setter
     def unit_power(self, value):
         self._unit_power = _validate_unit(value, dimension="power")
+        self._update_derived_units()
+        self._convert_quantities()
 
     @property
     def unit_time(self):
@@ -206,53 +841,54 @@ class Technology(object):
     @unit_time.setter
     def unit_time(self, value):
         self._unit_time = _validate_unit(value, dimension="time")
+        self._update_energy_units()
+        self._convert_quantities()
 
     @property
     def unit_energy(self):
-        return self._unit_power*self._unit_time
-
-    @unit_energy.setter
-    def unit_energy(self, value):
-        self._unit_energy = self._unit_power * self._unit_time
+        return self._unit_energy
 
     @property
     def capacity(self):
-        return self._capacity.to(self._unit_power)
+        return self._capacity.copy()
 
     @capacity.setter
     def capacity(self, value):
-        valid_quantity = _validate_quantity(value, dimension="power")
-        self._capacity = valid_quantity.to(self._unit_power)
+        self._capacity = _validate_quantity_fast(
+            value, _Dim.power, target_unit=self._unit_power)
 
     @property
     def capital_cost(self):
-        return self._capital_cost.to(self._unit_power**-1)
+        return self._capital_cost.copy()
 
     @capital_cost.setter
     def capital_cost(self, value):
-        self._capital_cost = _validate_quantity(value, dimension="spec_power")
+        self._capital_cost = _validate_quantity_fast(
+            value, _Dim.spec_power, target_unit=self._inv_unit_power)
 
     @property
     def om_cost_fixed(self):
-        return self._om_cost_fixed.to(self._unit_power**-1)
+        return self._om_cost_fixed.copy()
 
     @om_cost_fixed.setter
     def om_cost_fixed(self, value):
-        self._om_cost_fixed = _validate_quantity(value, dimension="spec_power")
+        self._om_cost_fixed = _validate_quantity_fast(
+            value, _Dim.spec_power, target_unit=self._inv_unit_power)
 
     @property
     def om_cost_variable(self):
-        return self._om_cost_variable.to(self.unit_energy**-1)
+        return self._om_cost_variable.copy()
 
     @om_cost_variable.setter
     def om_cost_variable(self, value):
-        self._om_cost_variable = _validate_quantity(
-            value, dimension="spec_energy")
+        self._om_cost_variable = _validate_quantity_fast(
+            value, _Dim.spec_energy, target_unit=self._inv_unit_energy)
 
     @property
     def fuel_cost(self):
-        return self._fuel_cost.to(self.unit_energy**-1)
+        return self._fuel_cost.copy()
 
     @fuel_cost.setter
     def fuel_cost(self, value):
-        self._fuel_cost = _validate_quantity(value, dimension="spec_energy")
+        self._fuel_cost = _validate_quantity_fast(
+            value, _Dim.spec_energy, target_unit=self._inv_unit_energy)
@@ -1,8 +1,8 @@
 import pytest
 import unyt
-from unyt import kW, MW, hr, BTU, Horsepower, day
+from unyt import kW, MW, GW, hr, BTU, Horsepower, day
 from osier import Technology
-from osier.technology import _validate_unit, _validate_quantity
+from osier.technology import _validate_unit, _validate_quantity, _dim_of
 from unyt.exceptions import UnitParseError
 
 TECH_NAME = "PlanetExpress"
@@ -38,6 +38,10 @@ def test_validate_unit():
         "Horsepower**-1",
         'spec_power').same_dimensions_as(
         MW**-1)
+    assert _validate_unit(
+        "(MW*hr)**-1",
+        'spec_energy').same_dimensions_as(
+        (MW * hr)**-1)
     assert _validate_unit(
         (Horsepower * day)**-1,
         'spec_energy').same_dimensions_as(
@@ -49,6 +53,25 @@ def test_validate_unit():
     with pytest.raises(KeyError) as e:
         _validate_unit("darkmatter", "fuel")
 
+    for malformed in ["MW*", "kW/", "MW-hr", "_"]:
+        with pytest.raises(ValueError) as e:
+            _validate_unit(malformed, "power")
+
+
+def test_validate_unit_cache():
+    assert _validate_unit("MW", 'power') is _validate_unit("MW", 'power')
+    with pytest.raises(ValueError) as e:
+        _validate_unit(["MW"], 'power')
+
+
+def test_dim_of():
+    assert _dim_of(kW) == 'power'
+    assert _dim_of(BTU) == 'energy'
+    assert _dim_of(day) == 'time'
+    assert _dim_of(Horsepower**-1) == 'spec_power'
+    assert _dim_of((Horsepower * day)**-1) == 'spec_energy'
+    assert _dim_of(unyt.m) is None
+
 
 def test_validate_quantity():
     assert _validate_quantity(power_unyt, 'power') == 10 * (MW)
@@ -59,14 +82,29 @@ def test_validate_quantity():
     assert _validate_quantity(10 * (Horsepower * day)**-1,
                               'spec_energy') == 10 * ((Horsepower * day)**-1)
 
+    assert _validate_quantity(power_unyt, 'power',
+                              target_unit=kW).units == kW
+    assert _validate_quantity(str_val, 'power',
+                              target_unit=kW) == 10000 * kW
+    assert _validate_quantity("1e3 kW", 'power') == 1 * MW
+    relabeled = _validate_quantity(10 * unyt.Unit("1000*kW"), 'power')
+    assert relabeled.value == 10.0
+    assert str(relabeled.units) == "MW"
+
     with pytest.raises(TypeError) as e:
         _validate_quantity(10 * MW, "energy")
+    with pytest.raises(TypeError) as e:
+        _validate_quantity(10 * MW, "energy", target_unit=MW * hr)
     with pytest.raises(UnitParseError) as e:
         _validate_quantity("10 darkmatter", "energy")
 
     with pytest.raises(KeyError) as e:
         _validate_quantity("10 darkmatter", "fuel")
 
+    for malformed in ["10 MW*", "10 kW/", "10 MW-hr", "10 _"]:
+        with pytest.raises(ValueError) as e:
+            _validate_quantity(malformed, "power")
+
 
 def test_initialize(advanced_tech):
     assert advanced_tech.technology_name == TECH_NAME
@@ -81,6 +119,36 @@ def test_initialize(advanced_tech):
     assert advanced_tech.unit_energy == MW * hr
 
 
+def test_initialize_units():
+    tech = Technology(TECH_NAME,
+                      capacity=float_val,
+                      om_cost_variable=str_val,
+                      default_power_units=kW,
+                      default_time_units=day)
+    assert tech.capacity == 10000 * kW
+    assert tech.om_cost_variable.value == pytest.approx(0.24)
+    assert tech.om_cost_variable.units == (kW * day)**-1
+
+
+def test_initialize_zero_defaults():
+    tech = Technology(TECH_NAME,
+                      default_power_units=kW,
+                      default_time_units=day)
+    assert tech.capacity.value == 0.0
+    assert tech.capacity.units == kW
+    assert tech.capital_cost.units == kW**-1
+    assert tech.om_cost_fixed.units == kW**-1
+    assert tech.om_cost_variable.units == (kW * day)**-1
+    assert tech.fuel_cost.value == 0.0
+    assert tech.fuel_cost.units == (kW * day)**-1
+
+    first = Technology(TECH_NAME)
+    second = Technology(TECH_NAME)
+    for attr in ["_capacity", "_capital_cost", "_om_cost_fixed",
+                 "_om_cost_variable", "_fuel_cost"]:
+        assert getattr(first, attr) is not getattr(second, attr)
+
+
 def test_attribute_types(advanced_tech):
     assert isinstance(advanced_tech.capacity, unyt.array.unyt_quantity)
     assert isinstance(advanced_tech.capital_cost, unyt.array.unyt_quantity)
@@ -92,6 +160,12 @@ def test_attribute_types(advanced_tech):
     assert isinstance(advanced_tech.unit_time, unyt.unit_object.Unit)
 
 
+def test_slots(advanced_tech):
+    assert not hasattr(advanced_tech, "__dict__")
+    with pytest.raises(AttributeError) as e:
+        advanced_tech.capacity_factor = 0.9
+
+
 def test_capacity(advanced_tech):
     with pytest.raises(ValueError) as e:
         advanced_tech.capacity = dict_type
@@ -120,8 +194,27 @@ def test_capacity(advanced_tech):
     assert advanced_tech.capacity.value == pytest.approx(0.007457, 0.005)
     assert advanced_tech.capacity.units == MW
 
+    advanced_tech.capacity = power_unyt
     advanced_tech.unit_power = "kW"
     assert advanced_tech.capacity.units == kW
+    assert advanced_tech.capacity.value == pytest.approx(10000.0)
+
+    capacity = advanced_tech.capacity
+    capacity *= 2
+    assert advanced_tech.capacity.value == pytest.approx(10000.0)
+
+
+def test_capacity_copies_input():
+    quantity = 10 * MW
+    tech = Technology(TECH_NAME, capacity=quantity)
+    assert tech.capacity.value == 10.0
+    assert tech.capacity.dtype == float
+    quantity += 5 * MW
+    assert tech.capacity == 10 * MW
+
+    tech.capacity = quantity
+    quantity *= 0
+    assert tech.capacity == 15 * MW
 
 
 def test_capital_cost(advanced_tech):
@@ -195,10 +288,10 @@ def test_om_cost_variable(advanced_tech):
         advanced_tech.om_cost_variable = unknown_str
     with pytest.raises(AssertionError) as e:
         advanced_tech.om_cost_variable = power_str
-    with pytest.raises(ValueError) as e:
-        advanced_tech.om_cost_variable = spec_energy_str
-    # assert advanced_tech.om_cost_variable.value == 10.0
-    # assert advanced_tech.om_cost_variable.units == (MW*hr)**-1
+
+    advanced_tech.om_cost_variable = spec_energy_str
+    assert advanced_tech.om_cost_variable.value == 10.0
+    assert advanced_tech.om_cost_variable.units == (MW * hr)**-1
 
     advanced_tech.om_cost_variable = spec_energy_unyt
     assert advanced_tech.om_cost_variable.value == 10.0
@@ -229,8 +322,10 @@ def test_fuel_cost(advanced_tech):
         advanced_tech.fuel_cost = unknown_str
     with pytest.raises(AssertionError) as e:
         advanced_tech.fuel_cost = power_str
-    with pytest.raises(ValueError) as e:
-        advanced_tech.fuel_cost = spec_energy_str
+
+    advanced_tech.fuel_cost = spec_energy_str
+    assert advanced_tech.fuel_cost.value == 10.0
+    assert advanced_tech.fuel_cost.units == (MW * hr)**-1
 
     advanced_tech.fuel_cost = spec_energy_unyt
     assert advanced_tech.fuel_cost.value == 10.0
@@ -287,15 +382,87 @@ def test_unit_time(advanced_tech):
 
 
 def test_unit_energy(advanced_tech):
-    advanced_tech.unit_energy = "darkmatter"
-    assert advanced_tech.unit_energy == MW*hr
-    advanced_tech.unit_energy = BTU
-    assert advanced_tech.unit_energy == MW*hr
-    advanced_tech.unit_energy = "MW"
-    assert advanced_tech.unit_energy == MW*hr
-    advanced_tech.unit_energy = 10
-    assert advanced_tech.unit_energy == MW*hr
-    advanced_tech.unit_energy = Horsepower * day
-    assert advanced_tech.unit_energy == MW*hr
-    advanced_tech.unit_energy = "Horsepower*day"
+    with pytest.raises(AttributeError) as e:
+        advanced_tech.unit_energy = BTU
+    with pytest.raises(AttributeError) as e:
+        advanced_tech.unit_energy = "Horsepower*day"
     assert advanced_tech.unit_energy == MW*hr
+
+    advanced_tech.unit_power = Horsepower
+    advanced_tech.unit_time = day
+    assert advanced_tech.unit_energy == Horsepower * day
+
+    tech = Technology(TECH_NAME, default_energy_units=BTU)
+    assert tech.unit_energy == MW*hr
+
+
+def test_from_arrays():
+    names = ["Bender", "Fry", "Leela"]
+    techs = Technology.from_arrays(names,
+                                   capacity=[1.0, 2.0, 3.0],
+                                   capital_cost=[1.0, 2.0, 3.0] / kW,
+                                   fuel_cost=float_val,
+                                   default_power_units="kW")
+    assert [t.technology_name for t in techs] == names
+    assert techs[1].technology_type == 'base'
+    assert techs[1].capacity == 2000 * kW
+    assert techs[1].capital_cost == 2.0 / kW
+    assert techs[2].fuel_cost.value == pytest.approx(0.01)
+    assert techs[2].fuel_cost.units == (kW * hr)**-1
+    assert techs[0].om_cost_fixed == 0.0
+
+    techs[0].capacity = power_unyt
+    assert techs[0].capacity == 10000 * kW
+    assert techs[1].capacity == 2000 * kW
+
+    techs = Technology.from_arrays(names[:2], capacity=[10 * MW, 5 * GW])
+    assert techs[0].capacity == 10 * MW
+    assert techs[1].capacity == 5000 * MW
+    techs = Technology.from_arrays(names[:2], capacity=[1 * kW, 2 * kW])
+    assert techs[1].capacity.value == pytest.approx(0.002)
+
+    with pytest.raises(TypeError) as e:
+        Technology.from_arrays(names, capacity=[1.0, 2.0, 3.0] * hr)
+    with pytest.raises(TypeError) as e:
+        Technology.from_arrays(names[:2], capacity=[1 * kW, 2 * hr])
+    with pytest.raises(ValueError) as e:
+        Technology.from_arrays(names[:2], capacity=[1 * kW, 2.0])
+    with pytest.raises(ValueError) as e:
+        Technology.from_arrays(names, capacity=[1.0, 2.0])
+    with pytest.raises(ValueError) as e:
+        Technology.from_arrays(names, technology_type=["robot", "human"])
+    with pytest.raises(ValueError) as e:
+        Technology.from_arrays(names[:1], technology_type=["robot", "human"])
+
+
+def test_to_arrays():
+    techs = [Technology("Bender", capacity=power_unyt),
+             Technology("Fry", capacity=float_val * other_power_unyt)]
+    columns = Technology.to_arrays(techs)
+    assert columns['technology_name'] == ["Bender", "Fry"]
+    assert columns['capacity'].units == MW
+    assert columns['capacity'][0] == power_unyt
+
+    roundtrip = Technology.from_arrays(**columns)
+    assert roundtrip[1].capacity == techs[1].capacity
+
+    empty = Technology.to_arrays([])
+    assert empty['technology_name'] == []
+    assert len(empty['capacity']) == 0
+    assert empty['capacity'].units == MW
+    assert Technology.from_arrays(**empty) == []
+
+
+def test_unchecked():
+    tech = Technology._unchecked(TECH_NAME,
+                                 capacity=power_unyt,
+                                 capital_cost=spec_power_unyt,
+                                 om_cost_fixed=spec_power_unyt,
+                                 om_cost_variable=spec_energy_unyt,
+                                 fuel_cost=spec_energy_unyt)
+    assert tech.capacity == power_unyt
+    assert tech.unit_energy == MW * hr
+
+    tech.unit_power = kW
+    assert tech.capacity == 10000 * kW
+    assert tech.fuel_cost.units == (kW * hr)**-1